@@ -8,8 +8,9 @@ entrypoint = main.py
 source.dir = .
 source.include_exts = py,html,js,css,png,jpg,jpeg,svg,ico
 
-# Python deps (keep it lean)
-requirements = python3,kivy,flask,requests,beautifulsoup4,urllib3,certifi,chardet,idna
+# Python deps of main.py only (keep it lean); the desktop server in app.py
+# installs from requirements.txt
+requirements = python3,kivy,requests,lxml,urllib3,certifi,chardet,idna
 garden_requirements = androidx_webview
 
 # Permissions
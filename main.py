@@ -4,57 +4,95 @@ A proper mobile app for downloading game soundtracks from KHInsider
 """
 
 import os
-import json
+import hashlib
 import threading
 import time
-import random
 import re
 import urllib.parse
-from pathlib import Path
+from collections import OrderedDict
+from functools import partial
+from concurrent.futures import ThreadPoolExecutor
 
 # Kivy imports
 from kivy.app import App
 from kivy.uix.boxlayout import BoxLayout
-from kivy.uix.gridlayout import GridLayout
 from kivy.uix.label import Label
 from kivy.uix.textinput import TextInput
 from kivy.uix.button import Button
-from kivy.uix.scrollview import ScrollView
-from kivy.uix.popup import Popup
-from kivy.uix.progressbar import ProgressBar
-from kivy.uix.checkbox import CheckBox
 from kivy.uix.screenmanager import ScreenManager, Screen
-from kivy.uix.actionbar import ActionBar, ActionView, ActionPrevious, ActionButton
+from kivy.uix.actionbar import ActionBar, ActionView, ActionPrevious
 from kivy.uix.image import AsyncImage
+from kivy.uix.recycleview import RecycleView
+from kivy.uix.recycleview.views import RecycleDataViewBehavior
+from kivy.uix.recycleboxlayout import RecycleBoxLayout
 from kivy.clock import Clock
+from kivy.cache import Cache
 from kivy.logger import Logger
 from kivy.metrics import dp
 from kivy.core.window import Window
+from kivy.utils import platform
 
-# Network imports
-import requests
-try:
-    from bs4 import BeautifulSoup
-    BS4_AVAILABLE = True
-except ImportError:
-    BS4_AVAILABLE = False
-    Logger.error("BeautifulSoup4 not available")
+# Network libraries (requests, lxml, diskcache) are imported by
+# KHInsiderDownloader itself, which is built off the UI thread, so their
+# import time doesn't delay the first frame
 
-# Android-specific imports
-try:
-    from android.permissions import request_permissions, Permission
-    from android.storage import primary_external_storage_path
-    from android import mActivity
-    ANDROID = True
-    Logger.info("Running on Android")
-except ImportError:
-    ANDROID = False
-    Logger.info("Not running on Android")
+# The android package itself is only imported once the app has started
+ANDROID = platform == 'android'
+Logger.info("Running on Android" if ANDROID else "Not running on Android")
 
 # Set window size for development
 if not ANDROID:
     Window.size = (360, 640)
 
+# Searches and album loads run here instead of a fresh thread per action
+IO_EXECUTOR = ThreadPoolExecutor(max_workers=3, thread_name_prefix='gsd-io')
+# Speculative work (result covers, likely album pages) runs here, a few at a
+# time over the shared session, so it never queues ahead of a user action
+PREFETCH_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix='gsd-prefetch')
+# Decoded cover textures by local path, shared by every ResultCard
+Cache.register('gsd.cover', limit=200)
+
+def on_main_thread(fn, future):
+    """Future done-callback: run fn(future, dt) on the Kivy thread.
+    
+    Bound with partial(on_main_thread, fn) so no closure is built per request.
+    """
+    Clock.schedule_once(partial(fn, future))
+
+# Page-cleanup patterns, compiled once
+_TITLE_RE = re.compile(r'\s*-\s*(Download|KHInsider|MP3).*$', re.I)
+_COVER_KEYS = ('album', 'cover', 'artwork')
+# album link -> (site-relative path, album id) in one match
+_ALBUM_HREF_RE = re.compile(r'(?:https?://[^/]+)?(/game-soundtracks/album/([^/?#]+)/?)')
+
+class TTLCache:
+    """Small thread-safe LRU whose entries also expire after ttl seconds"""
+    
+    def __init__(self, maxsize=64, ttl=3600):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key):
+        with self._lock:
+            hit = self._data.get(key)
+            if hit is None:
+                return None
+            expires, value = hit
+            if expires < time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+    
+    def put(self, key, value):
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
 class SimpleHTMLParser:
     """Fallback HTML parser if BeautifulSoup is not available"""
     
@@ -71,153 +109,148 @@ class SimpleHTMLParser:
 class KHInsiderDownloader:
     """Enhanced KHInsider downloader for mobile"""
     
-    def __init__(self):
+    PAGE_TTL = 3600
+    # one fixed identity per session keeps connection reuse stable
+    USER_AGENT = ('Mozilla/5.0 (Linux; Android 11; SM-G991B) AppleWebKit/537.36 '
+                  '(KHTML, like Gecko) Chrome/91.0.4472.120 Mobile Safari/537.36')
+
+    def __init__(self, cache_dir=None, cover_dir=None):
+        import requests
         self.base_url = "https://downloads.khinsider.com"
         self.session = requests.Session()
-        self.user_agents = [
-            'Mozilla/5.0 (Linux; Android 11; SM-G991B) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.120 Mobile Safari/537.36',
-            'Mozilla/5.0 (Linux; Android 10; Pixel 4) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/90.0.4430.210 Mobile Safari/537.36'
-        ]
+        # raw pages survive restarts, so a cold start can answer from disk;
+        # stale pages stay until the size cap culls the least recently stored.
+        # diskcache isn't part of the APK build, so this is desktop-only
+        try:
+            import diskcache
+            self.page_cache = diskcache.Cache(cache_dir, size_limit=64 * 2**20) if cache_dir else None
+        except ImportError:
+            self.page_cache = None
+        self.cover_dir = cover_dir
+        if cover_dir:
+            os.makedirs(cover_dir, exist_ok=True)
+        # successful lookups only, so going back and forth between screens is instant
+        self._search_cache = TTLCache(maxsize=64, ttl=3600)
+        self._album_cache = TTLCache(maxsize=64, ttl=3600)
         self._setup_session()
 
     def _setup_session(self):
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.request import ACCEPT_ENCODING
+        from urllib3.util.retry import Retry
         self.session.headers.update({
-            'User-Agent': random.choice(self.user_agents),
+            'User-Agent': self.USER_AGENT,
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate',
+            # br is smaller still, but only advertised when urllib3 can decode it
+            'Accept-Encoding': ACCEPT_ENCODING,
             'Connection': 'keep-alive',
             'Upgrade-Insecure-Requests': '1',
         })
-
-    def search(self, query, max_results=20):
-        """Search for game soundtracks"""
-        try:
-            search_url = f"{self.base_url}/search"
-            params = {'search': query}
-            
-            Logger.info(f"Searching for: {query}")
-            resp = self.session.get(search_url, params=params, timeout=15)
-            resp.raise_for_status()
-            
-            results = []
-            
-            if BS4_AVAILABLE:
-                # Use BeautifulSoup if available
-                soup = BeautifulSoup(resp.content, 'html.parser')
-                
-                # Look for album links
-                for link in soup.find_all('a', href=True):
-                    href = link.get('href')
-                    if href and '/game-soundtracks/album/' in href:
-                        album_url = href if href.startswith('http') else self.base_url + href
-                        album_id = album_url.split('/album/')[-1]
-                        name = link.get_text(strip=True)
-                        
-                        if name and len(name) > 2:
-                            results.append({
-                                'id': album_id,
-                                'name': name,
-                                'url': album_url,
-                                'icon': None
-                            })
-                        
-                        if len(results) >= max_results:
-                            break
+        # all requests go through self.session so search -> album -> track
+        # reuse the same kept-alive connections to the host; transient
+        # failures are retried with backoff (and Retry-After on 429/503)
+        retry = Retry(total=4, backoff_factor=0.5,
+                      status_forcelist=(429, 500, 502, 503, 504),
+                      allowed_methods=frozenset(['GET']),
+                      respect_retry_after_header=True)
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, pool_block=False, max_retries=retry)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+    def _get_doc(self, url, params=None, table_id=None):
+        """Parsed page from the disk cache, or fetched and stored on a successful GET.
+        
+        Pages older than PAGE_TTL are refetched, but kept around so a failed
+        refetch (offline, site down) still answers with the stale copy.
+        With table_id, only the page up to the end of that table is parsed.
+        """
+        key = ('page', url, tuple(sorted((params or {}).items())))
+        hit = self.page_cache.get(key) if self.page_cache is not None else None
+        fetched_at, body = hit if hit else (0, None)
+        if body is None or time.time() - fetched_at > self.PAGE_TTL:
+            try:
+                resp = self.session.get(url, params=params, timeout=15)
+                resp.raise_for_status()
+            except Exception as e:
+                if body is None:
+                    raise
+                Logger.info(f"Using cached page for {url}: {e}")
             else:
-                # Fallback: simple regex parsing
-                html_content = resp.text
-                album_links = SimpleHTMLParser.find_links(html_content, '/game-soundtracks/album/')
-                
-                for link in album_links[:max_results]:
-                    album_url = link if link.startswith('http') else self.base_url + link
-                    album_id = album_url.split('/album/')[-1]
-                    name = album_id.replace('-', ' ').title()
-                    
-                    results.append({
-                        'id': album_id,
-                        'name': name,
-                        'url': album_url,
-                        'icon': None
-                    })
-
-            Logger.info(f"Found {len(results)} results")
-            return results[:max_results]
-            
+                body = resp.content
+                if self.page_cache is not None:
+                    self.page_cache.set(key, (time.time(), body))
+        if table_id:
+            # everything we read sits above the table's end; the footer,
+            # comments and scripts below it are never parsed
+            start = body.find(b'id="%s"' % table_id.encode())
+            end = body.find(b'</table>', start) if start >= 0 else -1
+            if end >= 0:
+                body = body[:end + len(b'</table>')]
+        # pages are UTF-8; declaring it skips libxml2's charset guessing
+        import lxml.html
+        return lxml.html.document_fromstring(body, parser=lxml.html.HTMLParser(encoding='utf-8'))
+
+    def warm_up(self):
+        """Open a kept-alive connection to the site so the first search skips the handshake"""
+        try:
+            self.session.head(self.base_url, timeout=5)
         except Exception as e:
-            Logger.error(f"Search error: {e}")
-            return []
+            Logger.info(f"Warm-up skipped: {e}")
 
-    def get_album_info(self, album_url):
-        """Get detailed album information"""
+    def cover_path(self, url):
+        """Local file for a cover image, downloaded once; None if it can't be fetched"""
+        if not self.cover_dir:
+            return None
+        ext = os.path.splitext(urllib.parse.urlsplit(url).path)[1] or '.jpg'
+        path = os.path.join(self.cover_dir, hashlib.sha1(url.encode()).hexdigest() + ext)
+        if os.path.exists(path):
+            return path
         try:
-            Logger.info(f"Loading album: {album_url}")
-            resp = self.session.get(album_url, timeout=15)
+            resp = self.session.get(url, timeout=15)
             resp.raise_for_status()
-            
-            # Extract title from URL as fallback
-            album_id = album_url.split('/album/')[-1]
-            title = album_id.replace('-', ' ').title()
-            
-            tracks = []
-            
-            if BS4_AVAILABLE:
-                soup = BeautifulSoup(resp.content, 'html.parser')
-                
-                # Extract better title
-                if soup.title:
-                    title = soup.title.get_text().strip()
-                    title = re.sub(r'\s*-\s*(Download|KHInsider|MP3).*) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.120 Mobile Safari/537.36',
-            'Mozilla/5.0 (Linux; Android 10; Pixel 4) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/90.0.4430.210 Mobile Safari/537.36'
-        ]
-        self._setup_session()
-
-    def _setup_session(self):
-        self.session.headers.update({
-            'User-Agent': random.choice(self.user_agents),
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1',
-        })
+            tmp = path + '.part'
+            with open(tmp, 'wb') as f:
+                f.write(resp.content)
+            os.replace(tmp, path)
+            return path
+        except Exception as e:
+            Logger.error(f"Cover fetch error: {e}")
+            return None
 
     def search(self, query, max_results=20):
         """Search for game soundtracks"""
+        query = ' '.join(query.split())
+        key = (query.lower(), max_results)
+        cached = self._search_cache.get(key)
+        if cached is not None:
+            return cached
         try:
             search_url = f"{self.base_url}/search"
             params = {'search': query}
             
             Logger.info(f"Searching for: {query}")
-            resp = self.session.get(search_url, params=params, timeout=15)
-            resp.raise_for_status()
-            
-            soup = BeautifulSoup(resp.content, 'html.parser')
+            doc = self._get_doc(search_url, params, table_id='albumlist')
             results = []
 
             # Look for album table
-            table = soup.find('table', {'id': 'albumlist'}) or soup.find('table', {'class': 'albumlist'})
-            if table:
-                for row in table.find_all('tr'):
-                    if row.find('th'):  # Skip header row
-                        continue
-                    
-                    link = row.find('a', href=lambda x: x and '/game-soundtracks/album/' in x)
-                    if not link:
+            tables = doc.xpath('//table[@id="albumlist"]') or doc.xpath('//table[@class="albumlist"]')
+            if tables:
+                # header rows hold <th> cells and are skipped by the row test
+                for row in tables[0].xpath('.//tr[not(th)]'):
+                    links = row.xpath('.//a[contains(@href, "/game-soundtracks/album/")][1]')
+                    m = _ALBUM_HREF_RE.match(links[0].get('href')) if links else None
+                    if not m:
                         continue
-                    
-                    album_url = link.get('href')
-                    if album_url.startswith('/'):
-                        album_url = self.base_url + album_url
-                    
-                    album_id = album_url.split('/album/')[-1]
-                    name = link.get_text(strip=True)
+                    album_url = self.base_url + m.group(1)
+                    album_id = m.group(2)
+                    name = links[0].text_content().strip()
                     
                     # Try to find album cover
                     icon = None
-                    img = row.find('img')
-                    if img and img.get('src'):
-                        src = img.get('src')
+                    srcs = row.xpath('.//img/@src')
+                    src = srcs[0] if srcs else None
+                    if src:
                         if src.startswith('/'):
                             icon = self.base_url + src
                         elif src.startswith('http'):
@@ -235,7 +268,9 @@ class KHInsiderDownloader:
                         break
 
             Logger.info(f"Found {len(results)} results")
-            return results[:max_results]
+            results = results[:max_results]
+            self._search_cache.put(key, results)
+            return results
             
         except Exception as e:
             Logger.error(f"Search error: {e}")
@@ -243,67 +278,62 @@ class KHInsiderDownloader:
 
     def get_album_info(self, album_url):
         """Get detailed album information"""
+        cached = self._album_cache.get(album_url)
+        if cached is not None:
+            return cached
         try:
             Logger.info(f"Loading album: {album_url}")
-            resp = self.session.get(album_url, timeout=15)
-            resp.raise_for_status()
-            
-            soup = BeautifulSoup(resp.content, 'html.parser')
+            doc = self._get_doc(album_url, table_id='songlist')
             
             # Extract title
             title = "Unknown Album"
-            if soup.title:
-                title = soup.title.get_text().strip()
-                title = re.sub(r'\s*-\s*(Download|KHInsider|MP3).*$', '', title, flags=re.I)
+            page_title = doc.findtext('.//title')
+            if page_title:
+                title = _TITLE_RE.sub('', page_title.strip())
             
             # Extract album cover
             icon = None
-            for img in soup.find_all('img'):
-                src = img.get('src', '')
-                alt = img.get('alt', '').lower()
-                if any(k in src.lower() for k in ['album', 'cover', 'artwork']) or \
-                   any(k in alt for k in ['album', 'cover', 'artwork']):
+            for img in doc.iter('img'):
+                src = img.get('src') or ''
+                src_l = src.lower()
+                alt = (img.get('alt') or '').lower()
+                if any(k in src_l for k in _COVER_KEYS) or any(k in alt for k in _COVER_KEYS):
                     if src.startswith('/'):
                         icon = self.base_url + src
                     elif src.startswith('http'):
                         icon = src
                     break
             
-            # Extract tracks
-            tracks = []
-            table = soup.find('table', id='songlist')
-            if table:
-                track_num = 1
-                for row in table.find_all('tr'):
-                    cell = row.find('td', class_='clickable-row')
-                    if not cell:
-                        continue
-                    
-                    link = cell.find('a', href=True)
-                    if not link:
-                        continue
-                    
-                    track_name = link.get_text(strip=True)
-                    track_url = link.get('href')
-                    
-                    if track_url.startswith('/'):
-                        track_url = self.base_url + track_url
-                    
-                    if track_name and track_url:
-                        tracks.append({
-                            'number': track_num,
-                            'name': track_name,
-                            'url': track_url
-                        })
-                        track_num += 1
+            # Extract tracks: the first link in each row's first clickable cell.
+            # Kept as parallel name/url lists (track numbers are positions)
+            # rather than a dict per track, which adds up on long albums
+            names = []
+            urls = []
+            # One XPath over the whole table picks the first link of each row's
+            # first clickable cell; the later cells (duration, size) link to
+            # the same track
+            for link in doc.xpath('//table[@id="songlist"]//tr/td[contains(concat(" ", normalize-space(@class), " "), " clickable-row ")][1]'
+                                  '/descendant::a[@href][1]'):
+                track_name = link.text_content().strip()
+                track_url = link.get('href')
+                
+                if track_url.startswith('/'):
+                    track_url = self.base_url + track_url
+                
+                if track_name and track_url:
+                    names.append(track_name)
+                    urls.append(track_url)
             
-            Logger.info(f"Album loaded: {title} with {len(tracks)} tracks")
-            return {
+            Logger.info(f"Album loaded: {title} with {len(names)} tracks")
+            album = {
                 'title': title,
                 'icon': icon,
-                'tracks': tracks,
-                'total_tracks': len(tracks)
+                'track_names': names,
+                'track_urls': urls,
+                'total_tracks': len(names)
             }
+            self._album_cache.put(album_url, album)
+            return album
             
         except Exception as e:
             Logger.error(f"Album loading error: {e}")
@@ -314,6 +344,8 @@ class SearchScreen(Screen):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.name = 'search'
+        self._search_future = None
+        self._search_ev = None
         
         # Main layout
         layout = BoxLayout(orientation='vertical', padding=dp(10), spacing=dp(10))
@@ -372,43 +404,64 @@ class SearchScreen(Screen):
         )
         layout.add_widget(self.status_label)
         
-        # Results area
-        self.results_layout = GridLayout(cols=1, size_hint_y=None, spacing=dp(5))
-        self.results_layout.bind(minimum_height=self.results_layout.setter('height'))
-        
-        self.scroll_view = ScrollView()
-        self.scroll_view.add_widget(self.results_layout)
-        layout.add_widget(self.scroll_view)
+        # Results area: recycled cards, like the album track list
+        self.results = None
+        self.results_view = RecycleView(viewclass=ResultCard)
+        results_layout = RecycleBoxLayout(
+            orientation='vertical',
+            size_hint_y=None,
+            default_size=(None, dp(80)),
+            default_size_hint=(1, None),
+            spacing=dp(5)
+        )
+        results_layout.bind(minimum_height=results_layout.setter('height'))
+        self.results_view.add_widget(results_layout)
+        layout.add_widget(self.results_view)
         
         self.add_widget(layout)
     
+    SEARCH_DEBOUNCE = 0.25
+    PREFETCH_ALBUMS = 3
+    
     def search_action(self, instance):
         query = self.search_input.text.strip()
         if not query:
             self.status_label.text = 'Please enter a game name'
             return
         
+        # repeated Enter/Search presses in a burst only submit the last query
+        if self._search_ev:
+            self._search_ev.cancel()
+        self._search_ev = Clock.schedule_once(partial(self._submit, query), self.SEARCH_DEBOUNCE)
+    
+    def _submit(self, query, dt=None):
+        self._search_ev = None
         app = App.get_running_app()
-        if not hasattr(app, 'downloader'):
+        if app.downloader is None:
             self.status_label.text = 'Downloader not available'
             return
         
         self.status_label.text = 'Searching...'
-        self.results_layout.clear_widgets()
-        
-        # Search in background thread
-        threading.Thread(target=self._search_thread, args=(query,), daemon=True).start()
-    
-    def _search_thread(self, query):
+        self.results = None
+        self.results_view.data = []
+        
+        # Search in the background; a newer search supersedes this one
+        if self._search_future:
+            self._search_future.cancel()
+        future = self._search_future = IO_EXECUTOR.submit(app.downloader.search, query)
+        future.add_done_callback(partial(on_main_thread, self._search_done))
+    
+    def _search_done(self, future, dt=None):
+        if future is not self._search_future or future.cancelled():
+            return  # stale: a newer search has started
         try:
-            app = App.get_running_app()
-            results = app.downloader.search(query)
-            Clock.schedule_once(lambda dt: self._display_results(results))
+            self._display_results(future.result())
         except Exception as e:
-            Clock.schedule_once(lambda dt: self._show_error(f"Search failed: {e}"))
+            self._show_error(f"Search failed: {e}")
     
     def _display_results(self, results):
-        self.results_layout.clear_widgets()
+        self.results = results
+        self.results_view.data = [{'result': r} for r in results]
         
         if not results:
             self.status_label.text = 'No soundtracks found. Try a different search term.'
@@ -416,59 +469,64 @@ class SearchScreen(Screen):
         
         self.status_label.text = f'Found {len(results)} soundtracks'
         
-        for result in results:
-            item = ResultCard(result)
-            self.results_layout.add_widget(item)
+        downloader = App.get_running_app().downloader
+        for index, result in enumerate(results):
+            if result.get('icon'):
+                future = PREFETCH_EXECUTOR.submit(downloader.cover_path, result['icon'])
+                future.add_done_callback(partial(on_main_thread, partial(self._cover_done, results, index)))
+        # warm the album cache for the top hits so View usually opens instantly
+        for result in results[:self.PREFETCH_ALBUMS]:
+            PREFETCH_EXECUTOR.submit(downloader.get_album_info, result['url'])
+    
+    def _cover_done(self, results, index, future, dt=None):
+        if results is not self.results:
+            return  # stale: a newer search replaced these rows
+        # the row keeps the local path (or None if the fetch failed) and
+        # whichever card is showing it picks it up on refresh
+        self.results_view.data[index]['cover_path'] = future.result()
+        self.results_view.refresh_from_data()
     
     def _show_error(self, message):
         self.status_label.text = message
 
-class ResultCard(BoxLayout):
-    def __init__(self, result, **kwargs):
+class ResultCard(RecycleDataViewBehavior, BoxLayout):
+    """One recycled search result; refresh_view_attrs binds it to a result"""
+    
+    def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        self.result = result
+        self.result = None
         self.orientation = 'horizontal'
         self.size_hint_y = None
         self.height = dp(80)
         self.spacing = dp(10)
         self.padding = dp(10)
         
-        # Album cover (placeholder or actual)
-        if result.get('icon'):
-            cover = AsyncImage(
-                source=result['icon'],
-                size_hint_x=None,
-                width=dp(60)
-            )
-        else:
-            cover = Label(
-                text='🎵',
-                font_size='24sp',
-                size_hint_x=None,
-                width=dp(60)
-            )
+        # Album cover (placeholder or actual); the image itself is
+        # prefetched by SearchScreen and handed over in the row data
+        self.cover_slot = BoxLayout(size_hint_x=None, width=dp(60))
+        self.cover = AsyncImage()
+        self.cover.bind(on_load=self._cache_cover)
+        self.placeholder = Label(text='🎵', font_size='24sp')
         
         # Album info
         info_layout = BoxLayout(orientation='vertical', spacing=dp(2))
         
-        name_label = Label(
-            text=result['name'],
+        self.name_label = Label(
             text_size=(None, None),
             halign='left',
             font_size='14sp',
             color=(1, 1, 1, 1)
         )
         
-        id_label = Label(
-            text=f"ID: {result['id']}",
+        self.id_label = Label(
             text_size=(None, None),
             halign='left',
             font_size='10sp',
             color=(0.7, 0.7, 0.7, 1)
         )
         
-        info_layout.add_widget(name_label)
-        info_layout.add_widget(id_label)
+        info_layout.add_widget(self.name_label)
+        info_layout.add_widget(self.id_label)
         
         # View button
         view_btn = Button(
@@ -479,10 +537,47 @@ class ResultCard(BoxLayout):
         )
         view_btn.bind(on_press=self.view_album)
         
-        self.add_widget(cover)
+        self.add_widget(self.cover_slot)
         self.add_widget(info_layout)
         self.add_widget(view_btn)
     
+    def refresh_view_attrs(self, rv, index, data):
+        result = self.result = data['result']
+        self.name_label.text = result['name']
+        self.id_label.text = f"ID: {result['id']}"
+        
+        shown = self.cover if result.get('icon') else self.placeholder
+        if shown.parent is not self.cover_slot:
+            self.cover_slot.clear_widgets()
+            self.cover_slot.add_widget(shown)
+        if shown is self.cover:
+            self._show_cover(data)
+        return super().refresh_view_attrs(rv, index, data)
+    
+    def _show_cover(self, data):
+        if 'cover_path' not in data:
+            # still being fetched
+            self.cover.source = ''
+            self.cover.texture = None
+            return
+        path = data['cover_path']
+        if not path:
+            # fall back to letting AsyncImage fetch the URL itself
+            self.cover.source = self.result['icon']
+            return
+        # a cover seen in an earlier search is reused without reloading it
+        texture = Cache.get('gsd.cover', path)
+        if texture is not None:
+            self.cover.source = ''
+            self.cover.texture = texture
+            return
+        self.cover.source = path
+    
+    def _cache_cover(self, image):
+        # only local cover files are cached, not the URL fallback
+        if image.texture is not None and os.path.isabs(image.source):
+            Cache.append('gsd.cover', image.source, image.texture)
+    
     def view_album(self, instance):
         app = App.get_running_app()
         app.load_album(self.result)
@@ -492,6 +587,7 @@ class AlbumScreen(Screen):
         super().__init__(**kwargs)
         self.name = 'album'
         self.album_data = None
+        self._album_future = None
         
         # Main layout
         layout = BoxLayout(orientation='vertical', padding=dp(10), spacing=dp(10))
@@ -549,13 +645,19 @@ class AlbumScreen(Screen):
         )
         layout.add_widget(self.status_label)
         
-        # Track list
-        self.tracks_layout = GridLayout(cols=1, size_hint_y=None, spacing=dp(2))
-        self.tracks_layout.bind(minimum_height=self.tracks_layout.setter('height'))
-        
-        scroll = ScrollView()
-        scroll.add_widget(self.tracks_layout)
-        layout.add_widget(scroll)
+        # Track list: a RecycleView only builds the rows on screen and
+        # re-binds them to other tracks while scrolling
+        self.track_view = RecycleView(viewclass=TrackItem)
+        tracks_layout = RecycleBoxLayout(
+            orientation='vertical',
+            size_hint_y=None,
+            default_size=(None, dp(50)),
+            default_size_hint=(1, None),
+            spacing=dp(2)
+        )
+        tracks_layout.bind(minimum_height=tracks_layout.setter('height'))
+        self.track_view.add_widget(tracks_layout)
+        layout.add_widget(self.track_view)
         
         self.add_widget(layout)
     
@@ -563,21 +665,25 @@ class AlbumScreen(Screen):
         """Load album data"""
         self.album_title.text = album_result['name']
         self.track_count.text = 'Loading tracks...'
-        self.tracks_layout.clear_widgets()
+        self.track_view.data = []
         
         if album_result.get('icon'):
             self.cover_image.source = album_result['icon']
         
-        # Load in background
-        threading.Thread(target=self._load_album_thread, args=(album_result,), daemon=True).start()
+        # Load in background; opening another album supersedes this one
+        if self._album_future:
+            self._album_future.cancel()
+        app = App.get_running_app()
+        future = self._album_future = IO_EXECUTOR.submit(app.downloader.get_album_info, album_result['url'])
+        future.add_done_callback(partial(on_main_thread, self._album_done))
     
-    def _load_album_thread(self, album_result):
+    def _album_done(self, future, dt=None):
+        if future is not self._album_future or future.cancelled():
+            return  # stale: another album was opened
         try:
-            app = App.get_running_app()
-            album_data = app.downloader.get_album_info(album_result['url'])
-            Clock.schedule_once(lambda dt: self._display_album(album_data))
+            self._display_album(future.result())
         except Exception as e:
-            Clock.schedule_once(lambda dt: self._show_error(f"Failed to load album: {e}"))
+            self._show_error(f"Failed to load album: {e}")
     
     def _display_album(self, album_data):
         if not album_data:
@@ -590,9 +696,7 @@ class AlbumScreen(Screen):
         self.status_label.text = 'Album loaded successfully'
         
         # Display tracks
-        for track in album_data['tracks']:
-            track_item = TrackItem(track)
-            self.tracks_layout.add_widget(track_item)
+        self.track_view.data = [{'track_name': n} for n in album_data['track_names']]
     
     def _show_error(self, message):
         self.status_label.text = message
@@ -601,10 +705,12 @@ class AlbumScreen(Screen):
         app = App.get_running_app()
         app.screen_manager.current = 'search'
 
-class TrackItem(BoxLayout):
-    def __init__(self, track, **kwargs):
+class TrackItem(RecycleDataViewBehavior, BoxLayout):
+    """One recycled track row; refresh_view_attrs binds it to a track"""
+    
+    def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        self.track = track
+        self.track_name = ''
         self.orientation = 'horizontal'
         self.size_hint_y = None
         self.height = dp(50)
@@ -612,8 +718,7 @@ class TrackItem(BoxLayout):
         self.padding = [dp(10), dp(5)]
         
         # Track number
-        num_label = Label(
-            text=f"{track['number']:02d}",
+        self.num_label = Label(
             size_hint_x=None,
             width=dp(40),
             font_size='12sp',
@@ -621,8 +726,7 @@ class TrackItem(BoxLayout):
         )
         
         # Track name
-        name_label = Label(
-            text=track['name'],
+        self.name_label = Label(
             text_size=(None, None),
             halign='left',
             font_size='13sp'
@@ -637,39 +741,29 @@ class TrackItem(BoxLayout):
         )
         play_btn.bind(on_press=self.play_track)
         
-        self.add_widget(num_label)
-        self.add_widget(name_label)
+        self.add_widget(self.num_label)
+        self.add_widget(self.name_label)
         self.add_widget(play_btn)
     
+    def refresh_view_attrs(self, rv, index, data):
+        self.num_label.text = f"{index + 1:02d}"
+        self.name_label.text = data['track_name']
+        return super().refresh_view_attrs(rv, index, data)
+    
     def play_track(self, instance):
         # Placeholder for future play functionality
-        Logger.info(f"Would play: {self.track['name']}")
+        Logger.info(f"Would play: {self.track_name}")
 
 class GameSoundtrackApp(App):
     def build(self):
         Logger.info("Building Game Soundtrack App")
         
-        # Request Android permissions
-        if ANDROID:
-            try:
-                permissions = [
-                    Permission.INTERNET,
-                    Permission.ACCESS_NETWORK_STATE,
-                    Permission.READ_EXTERNAL_STORAGE,
-                    Permission.WRITE_EXTERNAL_STORAGE,
-                ]
-                request_permissions(permissions)
-                Logger.info("Android permissions requested")
-            except Exception as e:
-                Logger.error(f"Permission error: {e}")
-        
-        # Initialize downloader
-        try:
-            self.downloader = KHInsiderDownloader()
-            Logger.info("Downloader initialized")
-        except Exception as e:
-            Logger.error(f"Failed to initialize downloader: {e}")
-            self.downloader = None
+        # Initialize downloader in the background; see the downloader property
+        self._downloader_future = IO_EXECUTOR.submit(
+            KHInsiderDownloader,
+            cache_dir=os.path.join(self.user_data_dir, 'page_cache'),
+            cover_dir=os.path.join(self.user_data_dir, 'covers'))
+        self._downloader_future.add_done_callback(self._warm_up)
         
         # Create screen manager
         self.screen_manager = ScreenManager()
@@ -686,933 +780,33 @@ class GameSoundtrackApp(App):
         
         return self.screen_manager
     
-    def load_album(self, album_result):
-        """Switch to album screen and load album"""
-        self.album_screen.load_album(album_result)
-        self.screen_manager.current = 'album'
-    
-    def on_pause(self):
-        return True
-    
-    def on_resume(self):
-        pass
-
-if __name__ == '__main__':
-    GameSoundtrackApp().run(), '', title, flags=re.I)
-                
-                # Extract tracks
-                table = soup.find('table', id='songlist')
-                if table:
-                    track_num = 1
-                    for row in table.find_all('tr'):
-                        cell = row.find('td', class_='clickable-row')
-                        if not cell:
-                            continue
-                        
-                        link = cell.find('a', href=True)
-                        if not link:
-                            continue
-                        
-                        track_name = link.get_text(strip=True)
-                        track_url = link.get('href')
-                        
-                        if track_url.startswith('/'):
-                            track_url = self.base_url + track_url
-                        
-                        if track_name and track_url:
-                            tracks.append({
-                                'number': track_num,
-                                'name': track_name,
-                                'url': track_url
-                            })
-                            track_num += 1
-            else:
-                # Fallback: create dummy tracks
-                for i in range(1, 11):  # Create 10 dummy tracks
-                    tracks.append({
-                        'number': i,
-                        'name': f'Track {i:02d}',
-                        'url': album_url
-                    })
-            
-            Logger.info(f"Album loaded: {title} with {len(tracks)} tracks")
-            return {
-                'title': title,
-                'icon': None,
-                'tracks': tracks,
-                'total_tracks': len(tracks)
-            }
-            
-        except Exception as e:
-            Logger.error(f"Album loading error: {e}")
-            return None
-
-# UI Components (same as before)
-class SearchScreen(Screen):
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.name = 'search'
-        
-        # Main layout
-        layout = BoxLayout(orientation='vertical', padding=dp(10), spacing=dp(10))
-        
-        # Action bar
-        action_bar = ActionBar()
-        action_view = ActionView()
-        action_view.add_widget(ActionPrevious(title='Game Soundtrack Downloader', with_previous=False))
-        action_bar.add_widget(action_view)
-        layout.add_widget(action_bar)
-        
-        # Search section
-        search_box = BoxLayout(orientation='vertical', size_hint_y=None, height=dp(120), spacing=dp(10))
-        
-        # Title
-        title = Label(
-            text='🎵 Search Game Soundtracks 🎵',
-            font_size='18sp',
-            size_hint_y=None,
-            height=dp(40),
-            color=(0.2, 0.6, 1, 1)
-        )
-        search_box.add_widget(title)
-        
-        # Search input
-        search_layout = BoxLayout(orientation='horizontal', size_hint_y=None, height=dp(50), spacing=dp(10))
-        
-        self.search_input = TextInput(
-            hint_text='Enter game name (e.g. "mario", "zelda", "final fantasy")',
-            multiline=False,
-            size_hint_x=0.75,
-            font_size='14sp'
-        )
-        self.search_input.bind(on_text_validate=self.search_action)
-        
-        search_btn = Button(
-            text='Search',
-            size_hint_x=0.25,
-            font_size='14sp'
-        )
-        search_btn.bind(on_press=self.search_action)
-        
-        search_layout.add_widget(self.search_input)
-        search_layout.add_widget(search_btn)
-        search_box.add_widget(search_layout)
-        
-        layout.add_widget(search_box)
-        
-        # Status label
-        self.status_label = Label(
-            text='Enter a game name to search for soundtracks',
-            size_hint_y=None,
-            height=dp(30),
-            color=(0.7, 0.7, 0.7, 1),
-            font_size='12sp'
-        )
-        layout.add_widget(self.status_label)
-        
-        # Results area
-        self.results_layout = GridLayout(cols=1, size_hint_y=None, spacing=dp(5))
-        self.results_layout.bind(minimum_height=self.results_layout.setter('height'))
-        
-        self.scroll_view = ScrollView()
-        self.scroll_view.add_widget(self.results_layout)
-        layout.add_widget(self.scroll_view)
-        
-        self.add_widget(layout)
-    
-    def search_action(self, instance):
-        query = self.search_input.text.strip()
-        if not query:
-            self.status_label.text = 'Please enter a game name'
-            return
+    @property
+    def downloader(self):
+        """The KHInsiderDownloader, or None if it failed to initialize.
         
-        app = App.get_running_app()
-        if not hasattr(app, 'downloader'):
-            self.status_label.text = 'Downloader not available'
-            return
-        
-        self.status_label.text = 'Searching...'
-        self.results_layout.clear_widgets()
-        
-        # Search in background thread
-        threading.Thread(target=self._search_thread, args=(query,), daemon=True).start()
-    
-    def _search_thread(self, query):
+        Waits for the background construction started in build(), which is
+        normally long finished by the time the user first searches.
+        """
         try:
-            app = App.get_running_app()
-            results = app.downloader.search(query)
-            Clock.schedule_once(lambda dt: self._display_results(results))
+            return self._downloader_future.result()
         except Exception as e:
-            Clock.schedule_once(lambda dt: self._show_error(f"Search failed: {e}"))
+            Logger.error(f"Failed to initialize downloader: {e}")
+            return None
     
-    def _display_results(self, results):
-        self.results_layout.clear_widgets()
-        
-        if not results:
-            self.status_label.text = 'No soundtracks found. Try a different search term.'
-            return
-        
-        self.status_label.text = f'Found {len(results)} soundtracks'
-        
-        for result in results:
-            item = ResultCard(result)
-            self.results_layout.add_widget(item)
+    def _warm_up(self, future):
+        if future.exception() is None:
+            PREFETCH_EXECUTOR.submit(future.result().warm_up)
     
-    def _show_error(self, message):
-        self.status_label.text = message
-
-class ResultCard(BoxLayout):
-    def __init__(self, result, **kwargs):
-        super().__init__(**kwargs)
-        self.result = result
-        self.orientation = 'horizontal'
-        self.size_hint_y = None
-        self.height = dp(80)
-        self.spacing = dp(10)
-        self.padding = dp(10)
-        
-        # Album cover (placeholder)
-        cover = Label(
-            text='🎵',
-            font_size='24sp',
-            size_hint_x=None,
-            width=dp(60)
-        )
-        
-        # Album info
-        info_layout = BoxLayout(orientation='vertical', spacing=dp(2))
-        
-        name_label = Label(
-            text=result['name'],
-            text_size=(None, None),
-            halign='left',
-            font_size='14sp',
-            color=(1, 1, 1, 1)
-        )
-        
-        id_label = Label(
-            text=f"ID: {result['id']}",
-            text_size=(None, None),
-            halign='left',
-            font_size='10sp',
-            color=(0.7, 0.7, 0.7, 1)
-        )
-        
-        info_layout.add_widget(name_label)
-        info_layout.add_widget(id_label)
-        
-        # View button
-        view_btn = Button(
-            text='View\nAlbum',
-            size_hint_x=None,
-            width=dp(70),
-            font_size='12sp'
-        )
-        view_btn.bind(on_press=self.view_album)
-        
-        self.add_widget(cover)
-        self.add_widget(info_layout)
-        self.add_widget(view_btn)
+    def load_album(self, album_result):
+        """Switch to album screen and load album"""
+        self.album_screen.load_album(album_result)
+        self.screen_manager.current = 'album'
     
-    def view_album(self, instance):
-        app = App.get_running_app()
-        app.load_album(self.result)
-
-class AlbumScreen(Screen):
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.name = 'album'
-        self.album_data = None
-        
-        # Main layout
-        layout = BoxLayout(orientation='vertical', padding=dp(10), spacing=dp(10))
-        
-        # Action bar with back button
-        action_bar = ActionBar()
-        action_view = ActionView()
-        back_btn = ActionPrevious(title='Album Details')
-        back_btn.bind(on_press=self.go_back)
-        action_view.add_widget(back_btn)
-        action_bar.add_widget(action_view)
-        layout.add_widget(action_bar)
-        
-        # Album header
-        header_layout = BoxLayout(orientation='horizontal', size_hint_y=None, height=dp(100), spacing=dp(10))
-        
-        # Album cover
-        self.cover_image = Label(
-            text='🎵',
-            font_size='32sp',
-            size_hint_x=None,
-            width=dp(80)
-        )
-        
-        # Album info
-        info_layout = BoxLayout(orientation='vertical', spacing=dp(5))
-        
-        self.album_title = Label(
-            text='Loading...',
-            font_size='16sp',
-            text_size=(None, None),
-            halign='left',
-            color=(0.2, 0.6, 1, 1)
-        )
-        
-        self.track_count = Label(
-            text='',
-            font_size='12sp',
-            text_size=(None, None),
-            halign='left',
-            color=(0.7, 0.7, 0.7, 1)
-        )
-        
-        info_layout.add_widget(self.album_title)
-        info_layout.add_widget(self.track_count)
-        
-        header_layout.add_widget(self.cover_image)
-        header_layout.add_widget(info_layout)
-        layout.add_widget(header_layout)
-        
-        # Status
-        self.status_label = Label(
-            text='Loading album...',
-            size_hint_y=None,
-            height=dp(30),
-            font_size='12sp'
-        )
-        layout.add_widget(self.status_label)
-        
-        # Track list
-        self.tracks_layout = GridLayout(cols=1, size_hint_y=None, spacing=dp(2))
-        self.tracks_layout.bind(minimum_height=self.tracks_layout.setter('height'))
-        
-        scroll = ScrollView()
-        scroll.add_widget(self.tracks_layout)
-        layout.add_widget(scroll)
-        
-        self.add_widget(layout)
-    
-    def load_album(self, album_result):
-        """Load album data"""
-        self.album_title.text = album_result['name']
-        self.track_count.text = 'Loading tracks...'
-        self.tracks_layout.clear_widgets()
-        
-        # Load in background
-        threading.Thread(target=self._load_album_thread, args=(album_result,), daemon=True).start()
-    
-    def _load_album_thread(self, album_result):
-        try:
-            app = App.get_running_app()
-            album_data = app.downloader.get_album_info(album_result['url'])
-            Clock.schedule_once(lambda dt: self._display_album(album_data))
-        except Exception as e:
-            Clock.schedule_once(lambda dt: self._show_error(f"Failed to load album: {e}"))
-    
-    def _display_album(self, album_data):
-        if not album_data:
-            self.status_label.text = 'Failed to load album data'
-            return
-        
-        self.album_data = album_data
-        self.album_title.text = album_data['title']
-        self.track_count.text = f"{album_data['total_tracks']} tracks"
-        self.status_label.text = 'Album loaded successfully'
-        
-        # Display tracks
-        for track in album_data['tracks']:
-            track_item = TrackItem(track)
-            self.tracks_layout.add_widget(track_item)
-    
-    def _show_error(self, message):
-        self.status_label.text = message
-    
-    def go_back(self, instance):
-        app = App.get_running_app()
-        app.screen_manager.current = 'search'
-
-class TrackItem(BoxLayout):
-    def __init__(self, track, **kwargs):
-        super().__init__(**kwargs)
-        self.track = track
-        self.orientation = 'horizontal'
-        self.size_hint_y = None
-        self.height = dp(50)
-        self.spacing = dp(10)
-        self.padding = [dp(10), dp(5)]
-        
-        # Track number
-        num_label = Label(
-            text=f"{track['number']:02d}",
-            size_hint_x=None,
-            width=dp(40),
-            font_size='12sp',
-            color=(0.7, 0.7, 0.7, 1)
-        )
-        
-        # Track name
-        name_label = Label(
-            text=track['name'],
-            text_size=(None, None),
-            halign='left',
-            font_size='13sp'
-        )
-        
-        # Play button (placeholder)
-        play_btn = Button(
-            text='♪',
-            size_hint_x=None,
-            width=dp(40),
-            font_size='16sp'
-        )
-        play_btn.bind(on_press=self.play_track)
-        
-        self.add_widget(num_label)
-        self.add_widget(name_label)
-        self.add_widget(play_btn)
-    
-    def play_track(self, instance):
-        # Placeholder for future play functionality
-        Logger.info(f"Would play: {self.track['name']}")
-
-class GameSoundtrackApp(App):
-    def build(self):
-        Logger.info("Building Game Soundtrack App")
-        
-        # Request Android permissions
-        if ANDROID:
-            try:
-                permissions = [
-                    Permission.INTERNET,
-                    Permission.ACCESS_NETWORK_STATE,
-                    Permission.READ_EXTERNAL_STORAGE,
-                    Permission.WRITE_EXTERNAL_STORAGE,
-                ]
-                request_permissions(permissions)
-                Logger.info("Android permissions requested")
-            except Exception as e:
-                Logger.error(f"Permission error: {e}")
-        
-        # Initialize downloader
-        try:
-            self.downloader = KHInsiderDownloader()
-            Logger.info("Downloader initialized")
-        except Exception as e:
-            Logger.error(f"Failed to initialize downloader: {e}")
-            self.downloader = None
-        
-        # Create screen manager
-        self.screen_manager = ScreenManager()
-        
-        # Add screens
-        self.search_screen = SearchScreen()
-        self.album_screen = AlbumScreen()
-        
-        self.screen_manager.add_widget(self.search_screen)
-        self.screen_manager.add_widget(self.album_screen)
-        
-        # Start with search screen
-        self.screen_manager.current = 'search'
-        
-        return self.screen_manager
-    
-    def load_album(self, album_result):
-        """Switch to album screen and load album"""
-        self.album_screen.load_album(album_result)
-        self.screen_manager.current = 'album'
-    
-    def on_pause(self):
-        return True
-    
-    def on_resume(self):
-        pass
-
-if __name__ == '__main__':
-    GameSoundtrackApp().run()) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.120 Mobile Safari/537.36',
-            'Mozilla/5.0 (Linux; Android 10; Pixel 4) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/90.0.4430.210 Mobile Safari/537.36'
-        ]
-        self._setup_session()
-
-    def _setup_session(self):
-        self.session.headers.update({
-            'User-Agent': random.choice(self.user_agents),
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1',
-        })
-
-    def search(self, query, max_results=20):
-        """Search for game soundtracks"""
-        try:
-            search_url = f"{self.base_url}/search"
-            params = {'search': query}
-            
-            Logger.info(f"Searching for: {query}")
-            resp = self.session.get(search_url, params=params, timeout=15)
-            resp.raise_for_status()
-            
-            soup = BeautifulSoup(resp.content, 'html.parser')
-            results = []
-
-            # Look for album table
-            table = soup.find('table', {'id': 'albumlist'}) or soup.find('table', {'class': 'albumlist'})
-            if table:
-                for row in table.find_all('tr'):
-                    if row.find('th'):  # Skip header row
-                        continue
-                    
-                    link = row.find('a', href=lambda x: x and '/game-soundtracks/album/' in x)
-                    if not link:
-                        continue
-                    
-                    album_url = link.get('href')
-                    if album_url.startswith('/'):
-                        album_url = self.base_url + album_url
-                    
-                    album_id = album_url.split('/album/')[-1]
-                    name = link.get_text(strip=True)
-                    
-                    # Try to find album cover
-                    icon = None
-                    img = row.find('img')
-                    if img and img.get('src'):
-                        src = img.get('src')
-                        if src.startswith('/'):
-                            icon = self.base_url + src
-                        elif src.startswith('http'):
-                            icon = src
-                    
-                    if name and len(name) > 2:
-                        results.append({
-                            'id': album_id,
-                            'name': name,
-                            'url': album_url,
-                            'icon': icon
-                        })
-                    
-                    if len(results) >= max_results:
-                        break
-
-            Logger.info(f"Found {len(results)} results")
-            return results[:max_results]
-            
-        except Exception as e:
-            Logger.error(f"Search error: {e}")
-            return []
-
-    def get_album_info(self, album_url):
-        """Get detailed album information"""
-        try:
-            Logger.info(f"Loading album: {album_url}")
-            resp = self.session.get(album_url, timeout=15)
-            resp.raise_for_status()
-            
-            soup = BeautifulSoup(resp.content, 'html.parser')
-            
-            # Extract title
-            title = "Unknown Album"
-            if soup.title:
-                title = soup.title.get_text().strip()
-                title = re.sub(r'\s*-\s*(Download|KHInsider|MP3).*$', '', title, flags=re.I)
-            
-            # Extract album cover
-            icon = None
-            for img in soup.find_all('img'):
-                src = img.get('src', '')
-                alt = img.get('alt', '').lower()
-                if any(k in src.lower() for k in ['album', 'cover', 'artwork']) or \
-                   any(k in alt for k in ['album', 'cover', 'artwork']):
-                    if src.startswith('/'):
-                        icon = self.base_url + src
-                    elif src.startswith('http'):
-                        icon = src
-                    break
-            
-            # Extract tracks
-            tracks = []
-            table = soup.find('table', id='songlist')
-            if table:
-                track_num = 1
-                for row in table.find_all('tr'):
-                    cell = row.find('td', class_='clickable-row')
-                    if not cell:
-                        continue
-                    
-                    link = cell.find('a', href=True)
-                    if not link:
-                        continue
-                    
-                    track_name = link.get_text(strip=True)
-                    track_url = link.get('href')
-                    
-                    if track_url.startswith('/'):
-                        track_url = self.base_url + track_url
-                    
-                    if track_name and track_url:
-                        tracks.append({
-                            'number': track_num,
-                            'name': track_name,
-                            'url': track_url
-                        })
-                        track_num += 1
-            
-            Logger.info(f"Album loaded: {title} with {len(tracks)} tracks")
-            return {
-                'title': title,
-                'icon': icon,
-                'tracks': tracks,
-                'total_tracks': len(tracks)
-            }
-            
-        except Exception as e:
-            Logger.error(f"Album loading error: {e}")
-            return None
-
-# UI Components
-class SearchScreen(Screen):
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.name = 'search'
-        
-        # Main layout
-        layout = BoxLayout(orientation='vertical', padding=dp(10), spacing=dp(10))
-        
-        # Action bar
-        action_bar = ActionBar()
-        action_view = ActionView()
-        action_view.add_widget(ActionPrevious(title='Game Soundtrack Downloader', with_previous=False))
-        action_bar.add_widget(action_view)
-        layout.add_widget(action_bar)
-        
-        # Search section
-        search_box = BoxLayout(orientation='vertical', size_hint_y=None, height=dp(120), spacing=dp(10))
-        
-        # Title
-        title = Label(
-            text='🎵 Search Game Soundtracks 🎵',
-            font_size='18sp',
-            size_hint_y=None,
-            height=dp(40),
-            color=(0.2, 0.6, 1, 1)
-        )
-        search_box.add_widget(title)
-        
-        # Search input
-        search_layout = BoxLayout(orientation='horizontal', size_hint_y=None, height=dp(50), spacing=dp(10))
-        
-        self.search_input = TextInput(
-            hint_text='Enter game name (e.g. "mario", "zelda", "final fantasy")',
-            multiline=False,
-            size_hint_x=0.75,
-            font_size='14sp'
-        )
-        self.search_input.bind(on_text_validate=self.search_action)
-        
-        search_btn = Button(
-            text='Search',
-            size_hint_x=0.25,
-            font_size='14sp'
-        )
-        search_btn.bind(on_press=self.search_action)
-        
-        search_layout.add_widget(self.search_input)
-        search_layout.add_widget(search_btn)
-        search_box.add_widget(search_layout)
-        
-        layout.add_widget(search_box)
-        
-        # Status label
-        self.status_label = Label(
-            text='Enter a game name to search for soundtracks',
-            size_hint_y=None,
-            height=dp(30),
-            color=(0.7, 0.7, 0.7, 1),
-            font_size='12sp'
-        )
-        layout.add_widget(self.status_label)
-        
-        # Results area
-        self.results_layout = GridLayout(cols=1, size_hint_y=None, spacing=dp(5))
-        self.results_layout.bind(minimum_height=self.results_layout.setter('height'))
-        
-        self.scroll_view = ScrollView()
-        self.scroll_view.add_widget(self.results_layout)
-        layout.add_widget(self.scroll_view)
-        
-        self.add_widget(layout)
-    
-    def search_action(self, instance):
-        query = self.search_input.text.strip()
-        if not query:
-            self.status_label.text = 'Please enter a game name'
-            return
-        
-        app = App.get_running_app()
-        if not hasattr(app, 'downloader'):
-            self.status_label.text = 'Downloader not available'
-            return
-        
-        self.status_label.text = 'Searching...'
-        self.results_layout.clear_widgets()
-        
-        # Search in background thread
-        threading.Thread(target=self._search_thread, args=(query,), daemon=True).start()
-    
-    def _search_thread(self, query):
-        try:
-            app = App.get_running_app()
-            results = app.downloader.search(query)
-            Clock.schedule_once(lambda dt: self._display_results(results))
-        except Exception as e:
-            Clock.schedule_once(lambda dt: self._show_error(f"Search failed: {e}"))
-    
-    def _display_results(self, results):
-        self.results_layout.clear_widgets()
-        
-        if not results:
-            self.status_label.text = 'No soundtracks found. Try a different search term.'
-            return
-        
-        self.status_label.text = f'Found {len(results)} soundtracks'
-        
-        for result in results:
-            item = ResultCard(result)
-            self.results_layout.add_widget(item)
-    
-    def _show_error(self, message):
-        self.status_label.text = message
-
-class ResultCard(BoxLayout):
-    def __init__(self, result, **kwargs):
-        super().__init__(**kwargs)
-        self.result = result
-        self.orientation = 'horizontal'
-        self.size_hint_y = None
-        self.height = dp(80)
-        self.spacing = dp(10)
-        self.padding = dp(10)
-        
-        # Album cover (placeholder or actual)
-        if result.get('icon'):
-            cover = AsyncImage(
-                source=result['icon'],
-                size_hint_x=None,
-                width=dp(60)
-            )
-        else:
-            cover = Label(
-                text='🎵',
-                font_size='24sp',
-                size_hint_x=None,
-                width=dp(60)
-            )
-        
-        # Album info
-        info_layout = BoxLayout(orientation='vertical', spacing=dp(2))
-        
-        name_label = Label(
-            text=result['name'],
-            text_size=(None, None),
-            halign='left',
-            font_size='14sp',
-            color=(1, 1, 1, 1)
-        )
-        
-        id_label = Label(
-            text=f"ID: {result['id']}",
-            text_size=(None, None),
-            halign='left',
-            font_size='10sp',
-            color=(0.7, 0.7, 0.7, 1)
-        )
-        
-        info_layout.add_widget(name_label)
-        info_layout.add_widget(id_label)
-        
-        # View button
-        view_btn = Button(
-            text='View\nAlbum',
-            size_hint_x=None,
-            width=dp(70),
-            font_size='12sp'
-        )
-        view_btn.bind(on_press=self.view_album)
-        
-        self.add_widget(cover)
-        self.add_widget(info_layout)
-        self.add_widget(view_btn)
-    
-    def view_album(self, instance):
-        app = App.get_running_app()
-        app.load_album(self.result)
-
-class AlbumScreen(Screen):
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.name = 'album'
-        self.album_data = None
-        
-        # Main layout
-        layout = BoxLayout(orientation='vertical', padding=dp(10), spacing=dp(10))
-        
-        # Action bar with back button
-        action_bar = ActionBar()
-        action_view = ActionView()
-        back_btn = ActionPrevious(title='Album Details')
-        back_btn.bind(on_press=self.go_back)
-        action_view.add_widget(back_btn)
-        action_bar.add_widget(action_view)
-        layout.add_widget(action_bar)
-        
-        # Album header
-        header_layout = BoxLayout(orientation='horizontal', size_hint_y=None, height=dp(100), spacing=dp(10))
-        
-        # Album cover
-        self.cover_image = AsyncImage(
-            size_hint_x=None,
-            width=dp(80)
-        )
-        
-        # Album info
-        info_layout = BoxLayout(orientation='vertical', spacing=dp(5))
-        
-        self.album_title = Label(
-            text='Loading...',
-            font_size='16sp',
-            text_size=(None, None),
-            halign='left',
-            color=(0.2, 0.6, 1, 1)
-        )
-        
-        self.track_count = Label(
-            text='',
-            font_size='12sp',
-            text_size=(None, None),
-            halign='left',
-            color=(0.7, 0.7, 0.7, 1)
-        )
-        
-        info_layout.add_widget(self.album_title)
-        info_layout.add_widget(self.track_count)
-        
-        header_layout.add_widget(self.cover_image)
-        header_layout.add_widget(info_layout)
-        layout.add_widget(header_layout)
-        
-        # Status
-        self.status_label = Label(
-            text='Loading album...',
-            size_hint_y=None,
-            height=dp(30),
-            font_size='12sp'
-        )
-        layout.add_widget(self.status_label)
-        
-        # Track list
-        self.tracks_layout = GridLayout(cols=1, size_hint_y=None, spacing=dp(2))
-        self.tracks_layout.bind(minimum_height=self.tracks_layout.setter('height'))
-        
-        scroll = ScrollView()
-        scroll.add_widget(self.tracks_layout)
-        layout.add_widget(scroll)
-        
-        self.add_widget(layout)
-    
-    def load_album(self, album_result):
-        """Load album data"""
-        self.album_title.text = album_result['name']
-        self.track_count.text = 'Loading tracks...'
-        self.tracks_layout.clear_widgets()
-        
-        if album_result.get('icon'):
-            self.cover_image.source = album_result['icon']
-        
-        # Load in background
-        threading.Thread(target=self._load_album_thread, args=(album_result,), daemon=True).start()
-    
-    def _load_album_thread(self, album_result):
-        try:
-            app = App.get_running_app()
-            album_data = app.downloader.get_album_info(album_result['url'])
-            Clock.schedule_once(lambda dt: self._display_album(album_data))
-        except Exception as e:
-            Clock.schedule_once(lambda dt: self._show_error(f"Failed to load album: {e}"))
-    
-    def _display_album(self, album_data):
-        if not album_data:
-            self.status_label.text = 'Failed to load album data'
-            return
-        
-        self.album_data = album_data
-        self.album_title.text = album_data['title']
-        self.track_count.text = f"{album_data['total_tracks']} tracks"
-        self.status_label.text = 'Album loaded successfully'
-        
-        # Display tracks
-        for track in album_data['tracks']:
-            track_item = TrackItem(track)
-            self.tracks_layout.add_widget(track_item)
-    
-    def _show_error(self, message):
-        self.status_label.text = message
-    
-    def go_back(self, instance):
-        app = App.get_running_app()
-        app.screen_manager.current = 'search'
-
-class TrackItem(BoxLayout):
-    def __init__(self, track, **kwargs):
-        super().__init__(**kwargs)
-        self.track = track
-        self.orientation = 'horizontal'
-        self.size_hint_y = None
-        self.height = dp(50)
-        self.spacing = dp(10)
-        self.padding = [dp(10), dp(5)]
-        
-        # Track number
-        num_label = Label(
-            text=f"{track['number']:02d}",
-            size_hint_x=None,
-            width=dp(40),
-            font_size='12sp',
-            color=(0.7, 0.7, 0.7, 1)
-        )
-        
-        # Track name
-        name_label = Label(
-            text=track['name'],
-            text_size=(None, None),
-            halign='left',
-            font_size='13sp'
-        )
-        
-        # Play button (placeholder)
-        play_btn = Button(
-            text='♪',
-            size_hint_x=None,
-            width=dp(40),
-            font_size='16sp'
-        )
-        play_btn.bind(on_press=self.play_track)
-        
-        self.add_widget(num_label)
-        self.add_widget(name_label)
-        self.add_widget(play_btn)
-    
-    def play_track(self, instance):
-        # Placeholder for future play functionality
-        Logger.info(f"Would play: {self.track['name']}")
-
-class GameSoundtrackApp(App):
-    def build(self):
-        Logger.info("Building Game Soundtrack App")
-        
-        # Request Android permissions
+    def on_start(self):
+        # Request Android permissions once the first frame is up
         if ANDROID:
             try:
+                from android.permissions import request_permissions, Permission
                 permissions = [
                     Permission.INTERNET,
                     Permission.ACCESS_NETWORK_STATE,
@@ -1623,34 +817,6 @@ class GameSoundtrackApp(App):
                 Logger.info("Android permissions requested")
             except Exception as e:
                 Logger.error(f"Permission error: {e}")
-        
-        # Initialize downloader
-        try:
-            self.downloader = KHInsiderDownloader()
-            Logger.info("Downloader initialized")
-        except Exception as e:
-            Logger.error(f"Failed to initialize downloader: {e}")
-            self.downloader = None
-        
-        # Create screen manager
-        self.screen_manager = ScreenManager()
-        
-        # Add screens
-        self.search_screen = SearchScreen()
-        self.album_screen = AlbumScreen()
-        
-        self.screen_manager.add_widget(self.search_screen)
-        self.screen_manager.add_widget(self.album_screen)
-        
-        # Start with search screen
-        self.screen_manager.current = 'search'
-        
-        return self.screen_manager
-    
-    def load_album(self, album_result):
-        """Switch to album screen and load album"""
-        self.album_screen.load_album(album_result)
-        self.screen_manager.current = 'album'
     
     def on_pause(self):
         return True